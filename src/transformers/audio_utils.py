@@ -396,47 +396,65 @@ def spectrogram(
         padding = [(int(frame_length // 2), int(frame_length // 2))]
         waveform = np.pad(waveform, padding, mode=pad_mode)
 
-    # promote to float64, since np.fft uses float64 internally
-    waveform = waveform.astype(np.float64)
-    window = window.astype(np.float64)
+    # promote to float64, since np.fft uses float64 internally. The waveform itself is promoted when its frames are
+    # copied into the FFT buffer below, which saves a full-length copy of the (padded) waveform.
+    window = window.astype(np.float64, copy=False)
 
     # split waveform into frames of frame_length size
     num_frames = int(1 + np.floor((waveform.size - frame_length) / hop_length))
 
+    # strided view of shape (num_frames, frame_length) over the waveform, without copying it
+    frames = np.lib.stride_tricks.as_strided(
+        waveform,
+        shape=(num_frames, frame_length),
+        strides=(waveform.strides[0] * hop_length, waveform.strides[0]),
+        writeable=False,
+    )
+
     num_frequency_bins = (fft_length // 2) + 1 if onesided else fft_length
-    spectrogram = np.empty((num_frames, num_frequency_bins), dtype=np.complex64)
+    spectrogram = np.empty((num_frames, num_frequency_bins), dtype=np.complex64 if power is None else np.float64)
 
     # rfft is faster than fft
     fft_func = np.fft.rfft if onesided else np.fft.fft
-    buffer = np.zeros(fft_length)
 
-    timestep = 0
-    for frame_idx in range(num_frames):
-        buffer[:frame_length] = waveform[timestep : timestep + frame_length]
+    # Transform the frames in blocks: a single FFT call per block avoids a Python loop over the frames, while the
+    # zero-padded float64 buffer and the FFT output stay bounded by the block size rather than the waveform length.
+    block_size = max(1, min(num_frames, 512))
+    buffer = np.zeros((block_size, fft_length))
+
+    for block_start in range(0, num_frames, block_size):
+        block_end = min(block_start + block_size, num_frames)
+        block = buffer[: block_end - block_start]
+        block[:, :frame_length] = frames[block_start:block_end]
 
         if preemphasis is not None:
-            buffer[1:frame_length] -= preemphasis * buffer[: frame_length - 1]
-            buffer[0] *= 1 - preemphasis
+            block[:, 1:frame_length] -= preemphasis * block[:, : frame_length - 1]
+            block[:, 0] *= 1 - preemphasis
 
-        buffer[:frame_length] *= window
+        block[:, :frame_length] *= window
 
-        spectrogram[frame_idx] = fft_func(buffer)
-        timestep += hop_length
+        stft = fft_func(block, axis=-1).astype(np.complex64)
 
-    # note: ** is much faster than np.power
-    if power is not None:
-        spectrogram = np.abs(spectrogram, dtype=np.float64) ** power
+        # note: ** is much faster than np.power
+        if power is None:
+            spectrogram[block_start:block_end] = stft
+        else:
+            magnitudes = np.abs(stft, out=spectrogram[block_start:block_end], dtype=np.float64)
+            if power != 1.0:
+                magnitudes **= power
 
     spectrogram = spectrogram.T
 
     if mel_filters is not None:
-        spectrogram = np.maximum(mel_floor, np.dot(mel_filters.T, spectrogram))
+        spectrogram = np.dot(mel_filters.T, spectrogram)
+        np.maximum(spectrogram, mel_floor, out=spectrogram)
 
+    # the spectrogram is a freshly allocated array at this point, so it can be modified in place
     if power is not None and log_mel is not None:
         if log_mel == "log":
-            spectrogram = np.log(spectrogram)
+            np.log(spectrogram, out=spectrogram)
         elif log_mel == "log10":
-            spectrogram = np.log10(spectrogram)
+            np.log10(spectrogram, out=spectrogram)
         elif log_mel == "dB":
             if power == 1.0:
                 spectrogram = amplitude_to_db(spectrogram, reference, min_value, db_range)
@@ -493,7 +511,11 @@ def power_to_db(
     reference = max(min_value, reference)
 
     spectrogram = np.clip(spectrogram, a_min=min_value, a_max=None)
-    spectrogram = 10.0 * (np.log10(spectrogram) - np.log10(reference))
+    spectrogram = np.log10(spectrogram)
+    # log10(1.0) is zero, so skip a full pass over the spectrogram for the default reference
+    if reference != 1.0:
+        spectrogram -= np.log10(reference)
+    spectrogram *= 10.0
 
     if db_range is not None:
         if db_range <= 0.0:
@@ -542,7 +564,11 @@ def amplitude_to_db(
     reference = max(min_value, reference)
 
     spectrogram = np.clip(spectrogram, a_min=min_value, a_max=None)
-    spectrogram = 20.0 * (np.log10(spectrogram) - np.log10(reference))
+    spectrogram = np.log10(spectrogram)
+    # log10(1.0) is zero, so skip a full pass over the spectrogram for the default reference
+    if reference != 1.0:
+        spectrogram -= np.log10(reference)
+    spectrogram *= 20.0
 
     if db_range is not None:
         if db_range <= 0.0:
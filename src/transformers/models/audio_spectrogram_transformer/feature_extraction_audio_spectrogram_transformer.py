@@ -160,9 +160,16 @@ class ASTFeatureExtractor(SequenceFeatureExtractor):
                 "Failing to do so can result in silent errors that might be hard to debug."
             )
 
-        is_batched = bool(
-            isinstance(raw_speech, (list, tuple))
-            and (isinstance(raw_speech[0], np.ndarray) or isinstance(raw_speech[0], (tuple, list)))
+        is_batched_numpy = isinstance(raw_speech, np.ndarray) and raw_speech.ndim > 1
+        if is_batched_numpy and raw_speech.ndim > 2:
+            raise ValueError(f"Only mono-channel audio is supported for input to {self.__class__.__name__}")
+        if is_batched_numpy and raw_speech.shape[-1] == 1:
+            raise ValueError(
+                f"Got an input of shape {raw_speech.shape}, but 2-D arrays are treated as a batch of shape"
+                f" (batch_size, num_samples). Pass mono audio to {self.__class__.__name__} as a 1-D array."
+            )
+        is_batched = is_batched_numpy or (
+            isinstance(raw_speech, (list, tuple)) and isinstance(raw_speech[0], (np.ndarray, tuple, list))
         )
 
         if is_batched:
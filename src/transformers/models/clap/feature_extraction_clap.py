@@ -312,17 +312,22 @@ class ClapFeatureExtractor(SequenceFeatureExtractor):
                 "Failing to do so can result in silent errors that might be hard to debug."
             )
 
-        is_batched = bool(
-            isinstance(raw_speech, (list, tuple))
-            and (isinstance(raw_speech[0], np.ndarray) or isinstance(raw_speech[0], (tuple, list)))
+        is_batched_numpy = isinstance(raw_speech, np.ndarray) and raw_speech.ndim > 1
+        if is_batched_numpy and raw_speech.ndim > 2:
+            raise ValueError(f"Only mono-channel audio is supported for input to {self.__class__.__name__}")
+        if is_batched_numpy and raw_speech.shape[-1] == 1:
+            raise ValueError(
+                f"Got an input of shape {raw_speech.shape}, but 2-D arrays are treated as a batch of shape"
+                f" (batch_size, num_samples). Pass mono audio to {self.__class__.__name__} as a 1-D array."
+            )
+        is_batched = is_batched_numpy or (
+            isinstance(raw_speech, (list, tuple)) and isinstance(raw_speech[0], (np.ndarray, tuple, list))
         )
 
         if is_batched:
             raw_speech = [np.asarray(speech, dtype=np.float64) for speech in raw_speech]
         elif not is_batched and not isinstance(raw_speech, np.ndarray):
             raw_speech = np.asarray(raw_speech, dtype=np.float64)
-        elif isinstance(raw_speech, np.ndarray) and raw_speech.dtype is np.dtype(np.float64):
-            raw_speech = raw_speech.astype(np.float64)
 
         # always return batch
         if not is_batched:
@@ -345,9 +350,6 @@ class ClapFeatureExtractor(SequenceFeatureExtractor):
             rand_idx = np.random.randint(0, len(input_mel))
             is_longer[rand_idx] = True
 
-        if isinstance(input_mel[0], List):
-            input_mel = [np.asarray(feature, dtype=np.float64) for feature in input_mel]
-
         # is_longer is a list of bool
         is_longer = [[longer] for longer in is_longer]
 
@@ -16,7 +16,7 @@
 Feature extractor class for M-CTC-T
 """
 
-from typing import List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import torch
@@ -105,18 +105,13 @@ class MCTCTFeatureExtractor(SequenceFeatureExtractor):
         self.n_fft = optimal_fft_length(self.sample_size)
         self.n_freqs = (self.n_fft // 2) + 1
 
-    def _extract_mfsc_features(self, one_waveform: np.array) -> np.ndarray:
-        """
-        Extracts MFSC Features for one waveform vector (unbatched). Adapted from Flashlight's C++ MFSC code.
-        """
         if self.win_function == "hamming_window":
             window = torch.hamming_window(window_length=self.sample_size, periodic=False, alpha=0.54, beta=0.46)
         else:
-            window = getattr(torch, self.win_function)()
+            window = getattr(torch, self.win_function)(window_length=self.sample_size, periodic=False)
+        self.window = window.numpy()
 
-        window = window.numpy()
-
-        fbanks = mel_filter_bank(
+        self.mel_filters = mel_filter_bank(
             num_frequency_bins=self.n_freqs,
             num_mel_filters=self.feature_size,
             min_frequency=0.0,
@@ -124,15 +119,19 @@ class MCTCTFeatureExtractor(SequenceFeatureExtractor):
             sampling_rate=self.sampling_rate,
         )
 
+    def _extract_mfsc_features(self, one_waveform: np.array) -> np.ndarray:
+        """
+        Extracts MFSC Features for one waveform vector (unbatched). Adapted from Flashlight's C++ MFSC code.
+        """
         msfc_features = spectrogram(
             one_waveform * self.frame_signal_scale,
-            window=window,
+            window=self.window,
             frame_length=self.sample_size,
             hop_length=self.sample_stride,
             fft_length=self.n_fft,
             center=False,
             preemphasis=self.preemphasis_coeff,
-            mel_filters=fbanks,
+            mel_filters=self.mel_filters,
             mel_floor=self.mel_floor,
             log_mel="log",
         )
@@ -231,9 +230,16 @@ class MCTCTFeatureExtractor(SequenceFeatureExtractor):
                 "Failing to do so can result in silent errors that might be hard to debug."
             )
 
-        is_batched = bool(
-            isinstance(raw_speech, (list, tuple))
-            and (isinstance(raw_speech[0], np.ndarray) or isinstance(raw_speech[0], (tuple, list)))
+        is_batched_numpy = isinstance(raw_speech, np.ndarray) and raw_speech.ndim > 1
+        if is_batched_numpy and raw_speech.ndim > 2:
+            raise ValueError(f"Only mono-channel audio is supported for input to {self.__class__.__name__}")
+        if is_batched_numpy and raw_speech.shape[-1] == 1:
+            raise ValueError(
+                f"Got an input of shape {raw_speech.shape}, but 2-D arrays are treated as a batch of shape"
+                f" (batch_size, num_samples). Pass mono audio to {self.__class__.__name__} as a 1-D array."
+            )
+        is_batched = is_batched_numpy or (
+            isinstance(raw_speech, (list, tuple)) and isinstance(raw_speech[0], (np.ndarray, tuple, list))
         )
 
         if is_batched:
@@ -286,3 +292,14 @@ class MCTCTFeatureExtractor(SequenceFeatureExtractor):
             padded_inputs = padded_inputs.convert_to_tensors(return_tensors)
 
         return padded_inputs
+
+    def to_dict(self) -> Dict[str, Any]:
+        output = super().to_dict()
+
+        # Don't serialize these as they are derived from the other properties.
+        names = ["window", "mel_filters"]
+        for name in names:
+            if name in output:
+                del output[name]
+
+        return output
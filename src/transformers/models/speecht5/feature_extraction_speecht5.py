@@ -18,9 +18,8 @@ import warnings
 from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
-import torch
 
-from ...audio_utils import mel_filter_bank, optimal_fft_length, spectrogram
+from ...audio_utils import mel_filter_bank, optimal_fft_length, spectrogram, window_function
 from ...feature_extraction_sequence_utils import SequenceFeatureExtractor
 from ...feature_extraction_utils import BatchFeature
 from ...utils import PaddingStrategy, TensorType, logging
@@ -59,7 +58,8 @@ class SpeechT5FeatureExtractor(SequenceFeatureExtractor):
         win_length (`int`, *optional*, defaults to 64):
             Number of ms per window.
         win_function (`str`, *optional*, defaults to `"hann_window"`):
-            Name for the window function used for windowing, must be accessible via `torch.{win_function}`
+            Name for the window function used for windowing. Names not supported by [`~audio_utils.window_function`]
+            must be accessible via `torch.{win_function}`.
         frame_signal_scale (`float`, *optional*, defaults to 1.0):
             Constant multiplied in creating the frames before applying DFT. This argument is deprecated.
         fmin (`float`, *optional*, defaults to 80):
@@ -113,8 +113,14 @@ class SpeechT5FeatureExtractor(SequenceFeatureExtractor):
         self.n_fft = optimal_fft_length(self.sample_size)
         self.n_freqs = (self.n_fft // 2) + 1
 
-        window = getattr(torch, self.win_function)(window_length=self.sample_size, periodic=True)
-        self.window = window.numpy().astype(np.float64)
+        try:
+            self.window = window_function(window_length=self.sample_size, name=self.win_function, periodic=True)
+        except ValueError:
+            # other window types (e.g. "blackman_window") are still built with torch, so torch is only imported here
+            import torch
+
+            window = getattr(torch, self.win_function)(window_length=self.sample_size, periodic=True)
+            self.window = window.numpy().astype(np.float64)
 
         self.mel_filters = mel_filter_bank(
             num_frequency_bins=self.n_freqs,
@@ -307,9 +313,16 @@ class SpeechT5FeatureExtractor(SequenceFeatureExtractor):
         return_tensors: Optional[Union[str, TensorType]] = None,
         **kwargs,
     ) -> BatchFeature:
-        is_batched = bool(
-            isinstance(speech, (list, tuple))
-            and (isinstance(speech[0], np.ndarray) or isinstance(speech[0], (tuple, list)))
+        is_batched_numpy = isinstance(speech, np.ndarray) and speech.ndim > 1
+        if is_batched_numpy and speech.ndim > 2:
+            raise ValueError(f"Only mono-channel audio is supported for input to {self.__class__.__name__}")
+        if is_batched_numpy and speech.shape[-1] == 1:
+            raise ValueError(
+                f"Got an input of shape {speech.shape}, but 2-D arrays are treated as a batch of shape"
+                f" (batch_size, num_samples). Pass mono audio to {self.__class__.__name__} as a 1-D array."
+            )
+        is_batched = is_batched_numpy or (
+            isinstance(speech, (list, tuple)) and isinstance(speech[0], (np.ndarray, tuple, list))
         )
 
         if is_batched:
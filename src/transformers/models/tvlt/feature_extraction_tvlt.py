@@ -109,8 +109,11 @@ class TvltFeatureExtractor(SequenceFeatureExtractor):
             db_range=80.0,
         )
         log_spec = log_spec[:, :-1]
-        log_spec = log_spec - 20.0
-        log_spec = np.clip(log_spec / 40.0, -2.0, 0.0) + 1.0
+        # the spectrogram is freshly allocated, so rescale and clip it in place
+        log_spec -= 20.0
+        log_spec /= 40.0
+        np.clip(log_spec, -2.0, 0.0, out=log_spec)
+        log_spec += 1.0
         return log_spec
 
     def __call__(
@@ -176,26 +179,29 @@ class TvltFeatureExtractor(SequenceFeatureExtractor):
                 "Failing to do so can result in silent errors that might be hard to debug."
             )
 
-        is_batched = bool(
-            isinstance(raw_speech, (list, tuple))
-            and (isinstance(raw_speech[0], np.ndarray) or isinstance(raw_speech[0], (tuple, list)))
+        is_batched_numpy = isinstance(raw_speech, np.ndarray) and raw_speech.ndim > 1
+        if is_batched_numpy and raw_speech.ndim > 2:
+            raise ValueError(f"Only mono-channel audio is supported for input to {self.__class__.__name__}")
+        if is_batched_numpy and raw_speech.shape[-1] == 1:
+            # mono audio given as a (num_samples, 1) column is a single waveform, squeezed before extraction
+            is_batched_numpy = False
+        is_batched = is_batched_numpy or (
+            isinstance(raw_speech, (list, tuple)) and isinstance(raw_speech[0], (np.ndarray, tuple, list))
         )
         if is_batched:
-            raw_speech = [np.asarray([speech], dtype=np.float32).T for speech in raw_speech]
+            raw_speech = [np.asarray(speech, dtype=np.float32) for speech in raw_speech]
         elif not is_batched and not isinstance(raw_speech, np.ndarray):
             raw_speech = np.asarray(raw_speech, dtype=np.float32)
         elif isinstance(raw_speech, np.ndarray) and raw_speech.dtype is np.dtype(np.float64):
             raw_speech = raw_speech.astype(np.float32)
         # always return batch
         if not is_batched:
-            raw_speech = [np.asarray([raw_speech]).T]
+            raw_speech = [raw_speech]
 
         # Convert audio signals to log mel spectrograms, truncate by time axis
         audio_features = [
             self._np_extract_fbank_features(waveform.squeeze()).T[: self.spectrogram_length] for waveform in raw_speech
         ]
-        if isinstance(audio_features[0], List):
-            audio_features = [np.asarray(feature, dtype=np.float32) for feature in audio_features]
 
         # Create audio attention mask
         max_patch_len = max(
@@ -211,8 +217,9 @@ class TvltFeatureExtractor(SequenceFeatureExtractor):
 
         # convert into correct format for padding
         max_time_len = max_patch_len // self.freq_len * self.patch_size[0]  # The maximum audio size in a batch
-        padded_audio_features = np.ones([len(audio_features), 1, max_time_len, self.feature_size]).astype(np.float32)
-        padded_audio_features = padded_audio_features * self.padding_value
+        padded_audio_features = np.full(
+            [len(audio_features), 1, max_time_len, self.feature_size], self.padding_value, dtype=np.float32
+        )
         for i in range(len(audio_features)):
             feature = audio_features[i]
             padded_audio_features[i, :, : feature.shape[0], :] = feature
@@ -196,6 +196,9 @@ except importlib_metadata.PackageNotFoundError:
 _opencv_available = importlib.util.find_spec("cv2") is not None
 
 
+_scipy_available = importlib.util.find_spec("scipy") is not None
+
+
 _pytorch_quantization_available = importlib.util.find_spec("pytorch_quantization") is not None
 try:
     _pytorch_quantization_version = importlib_metadata.version("pytorch_quantization")
@@ -575,7 +578,7 @@ def is_faiss_available():
 
 
 def is_scipy_available():
-    return importlib.util.find_spec("scipy") is not None
+    return _scipy_available
 
 
 def is_sklearn_available():
@@ -189,6 +189,27 @@ class TvltFeatureExtractionTest(SequenceFeatureExtractionTestMixin, unittest.Tes
         self.assertTrue(encoded_audios.shape[-2] <= feature_extractor.spectrogram_length)
         self.assertTrue(encoded_audios.shape[-3] == feature_extractor.num_channels)
 
+        # Test 2-D numpy arrays are batched.
+        speech_inputs = [floats_list((1, x))[0] for x in (8000, 8000, 8000)]
+        np_speech_inputs = np.asarray(speech_inputs)
+        encoded_audios_1 = feature_extractor(speech_inputs, return_tensors="np", sampling_rate=44100).audio_values
+        encoded_audios_2 = feature_extractor(np_speech_inputs, return_tensors="np", sampling_rate=44100).audio_values
+        self.assertTrue(encoded_audios_2.ndim == 4)
+        self.assertTrue(encoded_audios_2.shape[-1] == feature_extractor.feature_size)
+        self.assertTrue(encoded_audios_2.shape[-2] <= feature_extractor.spectrogram_length)
+        self.assertTrue(encoded_audios_2.shape[-3] == feature_extractor.num_channels)
+        for enc_seq_1, enc_seq_2 in zip(encoded_audios_1, encoded_audios_2):
+            self.assertTrue(np.allclose(enc_seq_1, enc_seq_2, atol=1e-3))
+
+        # Test mono audio given as a (num_samples, 1) column vector is a single waveform.
+        speech_input = np_speech_inputs[0]
+        encoded_audios_1 = feature_extractor(speech_input, return_tensors="np", sampling_rate=44100).audio_values
+        encoded_audios_2 = feature_extractor(
+            speech_input[:, None], return_tensors="np", sampling_rate=44100
+        ).audio_values
+        self.assertTrue(encoded_audios_2.shape == encoded_audios_1.shape)
+        self.assertTrue(np.allclose(encoded_audios_1, encoded_audios_2, atol=1e-3))
+
     def _load_datasamples(self, num_samples):
         ds = load_dataset("hf-internal-testing/librispeech_asr_dummy", "clean", split="validation")
         # automatic decoding with librispeech
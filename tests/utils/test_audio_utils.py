@@ -606,6 +606,12 @@ class AudioUtilsFunctionTester(unittest.TestCase):
         expected = np.array([[0.0, -6.02059991, -4.51610582], [-63.01029996, -3.01029996, -63.01029996]])
         self.assertTrue(np.allclose(output, expected))
 
+        # the output dtype follows the input dtype, whatever the reference
+        output = power_to_db(spectrogram.astype(np.float32))
+        self.assertEqual(output.dtype, np.float32)
+        output = power_to_db(spectrogram.astype(np.float32), reference=2.0)
+        self.assertEqual(output.dtype, np.float32)
+
         with pytest.raises(ValueError):
             power_to_db(spectrogram, reference=0.0)
         with pytest.raises(ValueError):
@@ -644,6 +650,12 @@ class AudioUtilsFunctionTester(unittest.TestCase):
         expected = np.array([[0.0, -12.04119983, -9.03221164], [-66.02059991, -6.02059991, -66.02059991]])
         self.assertTrue(np.allclose(output, expected))
 
+        # the output dtype follows the input dtype, whatever the reference
+        output = amplitude_to_db(spectrogram.astype(np.float32))
+        self.assertEqual(output.dtype, np.float32)
+        output = amplitude_to_db(spectrogram.astype(np.float32), reference=2.0)
+        self.assertEqual(output.dtype, np.float32)
+
         with pytest.raises(ValueError):
             amplitude_to_db(spectrogram, reference=0.0)
         with pytest.raises(ValueError):